@@ -3,53 +3,107 @@
 # Vairë service management tool
 #
 
+from __future__ import annotations
+
 import argparse
+import collections
+import concurrent.futures
+import dataclasses
+import fnmatch
 import glob
+import json
 import logging
 import os
+import re
+import shutil
 import subprocess
 import sys
 import tempfile
 
-import aws_encryption_sdk as awscrypt
-import jinja2
 import yaml
 
+# aws_encryption_sdk, boto3, and jinja2 are imported lazily by the functions that need them:
+# they are slow to import and most subcommands (start, stop, status, reload) never touch them.
+
 _CONTAINER_LINK_DIR = "~/.config/containers/systemd"
 """Quadlet directory."""
+_LINKDIR = os.path.expanduser(_CONTAINER_LINK_DIR)
+"""Quadlet directory with the home directory expanded, computed once."""
 _SECRET_CFG = "secrets.yml"
 """Primary source for secrets, passwords, API keys, etc."""
 _SERVICE_CFG = "services.yml"
 """Service configuration."""
 _STATE_CFG = ".state.yml"
 """Service state tracking file."""
+_IO_BUFFER_SIZE = 1 << 20
+"""Buffer size for streaming file encryption and decryption."""
+
+try:
+    _YAML_LOADER = yaml.CSafeLoader
+except AttributeError:
+    # PyYAML was built without the LibYAML bindings; fall back to the pure-Python implementation.
+    _YAML_LOADER = yaml.SafeLoader
+
+_YAML_CACHE_SIZE = 16
+"""Maximum number of parsed YAML files to retain in the cache."""
+
+_yaml_cache: collections.OrderedDict[str, tuple[int, int, dict]] = collections.OrderedDict()
+"""Parsed YAML cache, mapping file path to (mtime_ns, size, parsed content)."""
+
+_SECRET_SIDECAR = "VAIRE_SECRETS_JSON" in os.environ
+"""True to maintain a JSON sidecar for secrets.yml; opt-in since it duplicates the secrets on disk."""
+
+_template_env = None
+"""Lazily constructed Jinja2 environment, long-lived so compiled templates are cached across calls."""
 
 _verbose = False
 """Verbose flag; display extra logging and debug information if True."""
 _logger = logging.getLogger(__name__)
 """Logger instance."""
+_DEVNULL_FD = os.open(os.devnull, os.O_WRONLY)
+"""Shared file descriptor for discarding subprocess output, opened once rather than per call."""
 
 
+@dataclasses.dataclass(slots=True)
 class Service:
     """Representation of a configured service."""
 
-    def __init__(self, name: str, properties: dict, deployed: bool):
-        """Instantiate a service representation.
+    name: str
+    start: list[str]
+    stop: list[str]
+    quadlets: list[str]
+    quadlet_links: list[tuple[str, str]]
+    crontab: str
+    backups: list[str]
+    secret_files: list[str]
+    deployed: bool
+    selected: bool = False
+
+    @classmethod
+    def from_yaml(cls, name: str, properties: dict, deployed: bool) -> "Service":
+        """Instantiate a service representation from its parsed YAML properties.
 
         Args:
             name (str): Service name.
             properties (dict): Service properties loaded from YAML file.
             deployed (bool): True if the service has been deployed (quadlets and crontab installed).
+
+        Returns:
+            Service: Assembled service representation.
         """
-        self.name = name
-        self.start = properties.get("start", [])
-        self.stop = properties.get("stop", [])
-        self.quadlets = properties.get("quadlets", [])
-        self.crontab = properties.get("crontab", "")
-        self.backups = properties.get("backups", [])
-        self.secret_files = properties.get("secretfiles", [])
-        self.deployed = deployed
-        self.selected = False
+        quadlets = properties.get("quadlets", [])
+        cwd = os.getcwd()
+        return cls(
+            name=name,
+            start=properties.get("start", []),
+            stop=properties.get("stop", []),
+            quadlets=quadlets,
+            quadlet_links=[(os.path.join(cwd, q), os.path.join(_LINKDIR, os.path.basename(q))) for q in quadlets],
+            crontab=properties.get("crontab", ""),
+            backups=properties.get("backups", []),
+            secret_files=properties.get("secretfiles", []),
+            deployed=deployed,
+        )
 
 
 def write_state(args: argparse.Namespace) -> None:
@@ -58,52 +112,73 @@ def write_state(args: argparse.Namespace) -> None:
     Args:
         args (argparse.Namespace): Arguments containing service states.
     """
-    state = {"deployed": {s.name: s.deployed for s in args.services}}
+    # The state file is a trivial name -> bool mapping, so emit the YAML directly in one write
+    # rather than going through a full dumper pass.
+    if args.services:
+        content = "deployed:\n" + "".join(f"  {s.name}: {'true' if s.deployed else 'false'}\n" for s in args.services)
+    else:
+        content = "deployed: {}\n"
     with open(_STATE_CFG, mode="w") as cfg:
-        yaml.safe_dump(state, cfg)
-    _logger.debug(f"Wrote {_STATE_CFG}")
+        cfg.write(content)
+    _logger.debug("Wrote %s", _STATE_CFG)
 
 
-def run(cmd: list[str], checked: bool = True, env: dict = None) -> bool:
+def run(cmd: list[str], checked: bool = True, env: dict = None, capture: bool = False) -> bool | str:
     """Run an executable.
 
     Args:
         cmd (list[str]): Command and parameters to execute.
         checked (bool, optional): Check for success (return code of 0). Defaults to True.
         env (dict, optional): Extra environment variables to merge into the process's environment. Defaults to None.
+        capture (bool, optional): Capture standard output and return it instead of the success flag.
+            Defaults to False.
 
     Returns:
-        bool: True if the command suceeded (returned 0), False otherwise.
+        bool | str: Captured standard output if capture is True, otherwise True if the command
+            suceeded (returned 0), False otherwise.
     """
-    _logger.debug(f"Command: {' '.join(cmd)}")
-    fullenv = None
-    if env:
-        fullenv = dict(os.environ)
-        fullenv.update(env)
-
-    if _verbose:
-        result = subprocess.run(cmd, env=fullenv)
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug("Command: %s", " ".join(cmd))
+    fullenv = {**os.environ, **env} if env else None
+
+    # close_fds=False keeps subprocess on CPython's vfork/posix_spawn fast path, and the shared
+    # /dev/null descriptor avoids reopening it for every spawned process.
+    if capture:
+        result = subprocess.run(
+            cmd,
+            env=fullenv,
+            stdout=subprocess.PIPE,
+            stderr=None if _verbose else _DEVNULL_FD,
+            text=True,
+            close_fds=False,
+        )
+    elif _verbose:
+        result = subprocess.run(cmd, env=fullenv, close_fds=False)
     else:
-        result = subprocess.run(cmd, env=fullenv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        result = subprocess.run(cmd, env=fullenv, stdout=_DEVNULL_FD, stderr=_DEVNULL_FD, close_fds=False)
 
-    _logger.debug(f"Result: {result.returncode}")
+    _logger.debug("Result: %d", result.returncode)
     if checked:
         result.check_returncode()
+    if capture:
+        return result.stdout
     return result.returncode == 0
 
 
-def systemctl(*args, checked=True) -> bool:
+def systemctl(*args, checked=True, capture=False) -> bool | str:
     """Execute a systemd command.
 
     Args:
         args: The systemctl command to execute.
         checked (bool, optional): Check for success. Defaults to True.
+        capture (bool, optional): Capture and return standard output. Defaults to False.
 
     Returns:
-        bool: True of the command suceeded, False otherwise.
+        bool | str: Captured standard output if capture is True, otherwise True if the command
+            suceeded, False otherwise.
     """
     cmd = ["systemctl", "--user"] + [*args]
-    return run(cmd, checked=checked)
+    return run(cmd, checked=checked, capture=capture)
 
 
 def reload(args: argparse.Namespace) -> None:
@@ -122,10 +197,13 @@ def start(args: argparse.Namespace) -> None:
     Args:
         args (argparse.Namespace): Command line parameters and services list.
     """
+    units = []
     for service in args.services:
         if service.selected and service.start:
-            _logger.info(f"Starting {service.name}")
-            systemctl("start", *service.start)
+            _logger.info("Starting %s", service.name)
+            units += service.start
+    if units:
+        systemctl("start", *units)
 
 
 def stop(args: argparse.Namespace) -> None:
@@ -134,10 +212,13 @@ def stop(args: argparse.Namespace) -> None:
     Args:
         args (argparse.Namespace): Command line parameters and services list.
     """
+    units = []
     for service in args.services:
         if service.selected and service.stop:
-            _logger.info(f"Stopping {service.name}")
-            systemctl("stop", *service.stop)
+            _logger.info("Stopping %s", service.name)
+            units += service.stop
+    if units:
+        systemctl("stop", *units)
 
 
 def restart(args: argparse.Namespace) -> None:
@@ -156,22 +237,28 @@ def deploy(args: argparse.Namespace) -> None:
     Args:
         args (argparse.Namespace): Command line parameters and services list.
     """
-    linkdir = os.path.expanduser(_CONTAINER_LINK_DIR)
+    os.makedirs(_LINKDIR, exist_ok=True)
 
+    changed = False
     for service in args.services:
         if service.selected and not service.deployed:
-            _logger.info(f"Deploying {service.name}")
-            for quadlet in service.quadlets:
-                source = os.path.abspath(quadlet)
-                filename = os.path.basename(quadlet)
-                destination = os.path.join(linkdir, filename)
-                os.symlink(fullpath, dst)
+            _logger.info("Deploying %s", service.name)
+            for source, destination in service.quadlet_links:
+                try:
+                    os.symlink(source, destination)
+                    changed = True
+                except FileExistsError:
+                    if not os.path.islink(destination) or os.readlink(destination) != source:
+                        os.remove(destination)
+                        os.symlink(source, destination)
+                        changed = True
             service.deployed = True
 
     crontab(args)
     secrets(args)
     write_state(args)
-    reload(args)
+    if changed:
+        reload(args)
 
 
 def undeploy(args: argparse.Namespace) -> None:
@@ -182,22 +269,22 @@ def undeploy(args: argparse.Namespace) -> None:
     """
     stop(args)
 
-    linkdir = os.path.expanduser(_CONTAINER_LINK_DIR)
+    changed = False
     for service in args.services:
         if service.selected and service.deployed:
-            _logger.info(f"Undeploying {service.name}")
-            for quadlet in service.quadlets:
-                filename = os.path.basename(quadlet)
-                destination = os.path.join(linkdir, filename)
+            _logger.info("Undeploying %s", service.name)
+            for _, destination in service.quadlet_links:
                 try:
                     os.remove(destination)
+                    changed = True
                 except FileNotFoundError:
                     pass
             service.deployed = False
 
     crontab(args)
     write_state(args)
-    reload(args)
+    if changed:
+        reload(args)
 
 
 def status(args: argparse.Namespace) -> None:
@@ -208,23 +295,20 @@ def status(args: argparse.Namespace) -> None:
     """
     _logger.debug("Displaying service status")
 
-    statuses = []
-    longest = 0
-    for service in args.services:
-        status = {"name": service.name, "deployed": "no", "running": "no"}
-        if service.deployed:
-            status["deployed"] = "yes"
-            if service.start:
-                status["running"] = "yes" if systemctl("is-active", *service.start, checked=False) else "no"
-            else:
-                status["running"] = "yes"
-        statuses.append(status)
-        if len(service.name) > longest:
-            longest = len(service.name)
+    units = [unit for s in args.services if s.deployed and s.start for unit in s.start]
+    active = {}
+    if units:
+        # is-active prints one state per unit in argument order, so probe them all in one call.
+        states = systemctl("is-active", *units, checked=False, capture=True).split()
+        active = dict(zip(units, states))
+
+    longest = max((len(service.name) for service in args.services), default=0)
 
     print(f"{'SERVICE':<{longest}} DEPLOYED RUNNING")
-    for row in statuses:
-        print(f"{row["name"]:<{longest}} {row["deployed"]:<{len('DEPLOYED')}} {row["running"]}")
+    for service in args.services:
+        deployed = "yes" if service.deployed else "no"
+        running = "yes" if service.deployed and all(active.get(unit) == "active" for unit in service.start) else "no"
+        print(f"{service.name:<{longest}} {deployed:<{len('DEPLOYED')}} {running}")
 
 
 def crontab(args: argparse.Namespace) -> None:
@@ -234,10 +318,15 @@ def crontab(args: argparse.Namespace) -> None:
         args (argparse.Namespace): Command line parameters and services list.
     """
     _logger.info("Refreshing crontab")
+    content = "".join(service.crontab for service in args.services if service.deployed and service.crontab)
+
+    current = run(["crontab", "-l"], checked=False, capture=True)
+    if current == content:
+        _logger.debug("Crontab unchanged")
+        return
+
     with tempfile.NamedTemporaryFile(mode="w") as tmpcrontab:
-        for service in args.services:
-            if service.deployed and service.crontab:
-                tmpcrontab.write(service.crontab)
+        tmpcrontab.write(content)
         tmpcrontab.flush()
 
         cmd = ["crontab", "-n", tmpcrontab.name]
@@ -246,95 +335,109 @@ def crontab(args: argparse.Namespace) -> None:
         run(cmd)
 
 
-def xcrypt(
-    crypto: awscrypt.EncryptionSDKClient,
-    key: awscrypt.StrictAwsKmsMasterKeyProvider,
-    encrypt: bool,
-    source: str,
-    dest: str,
-) -> None:
-    """Encrypt or decrypt a file using an AWS KMS key.
+def make_bucket_client(secrets: dict) -> tuple:
+    """Assemble the pieces needed to move encrypted backups to and from the S3 bucket.
 
     Args:
-        crypto (awscrypt.EncryptionSDKClient): AWS client side encryption instance.
-        key (awscrypt.StrictAwsKmsMasterKeyProvider): AWS key provider instance.
-        encrypt (bool): True to encrypt source to destination, False to decrypt source to destination.
-        source (str): File to read from.
-        dest (str): File to write to.
+        secrets (dict): Tree of secrets.
+
+    Returns:
+        tuple: Encryption client, KMS key provider, S3 client, and bucket name.
     """
-    _logger.debug(f"{'En' if encrypt else 'De'}crypting {source} to {dest}")
+    import aws_encryption_sdk as awscrypt
+    import boto3
 
-    with open(source, mode="rb") as instream, open(dest, mode="wb") as outstream:
-        with crypto.stream(mode="e" if encrypt else "d", source=instream, key_provider=key) as cryptor:
-            for chunk in cryptor:
-                outstream.write(chunk)
+    backup_cfg = secrets["services"]["backup"]
+    crypto = awscrypt.EncryptionSDKClient()
+    key = awscrypt.StrictAwsKmsMasterKeyProvider(key_ids=[backup_cfg["key_arn"]])
+    s3 = boto3.client("s3", region_name=backup_cfg["region"])
+    return crypto, key, s3, backup_cfg["bucket"]
 
 
-def mount_bucket(bucket: str, region: str) -> str:
-    """Mount an S3 bucket as a directory.
+def _find_backups(patterns: list[str]) -> list[str]:
+    """Resolve backup file patterns to the files they match.
+
+    Patterns with wildcards only in the final component are matched with a single scandir and one
+    precompiled regex, avoiding glob's per-name fnmatch calls; anything more involved (wildcard
+    directories, ``**``) falls back to recursive glob.
 
     Args:
-        bucket (str): Bucket name.
-        region (str): AWS region name.
+        patterns (list[str]): Glob patterns to resolve.
 
     Returns:
-        str: Name of the mount point.
+        list[str]: Paths of the matching files.
     """
-    _logger.debug("Mounting S3 bucket")
-    mountpoint = tempfile.mkdtemp()
-
-    cmd = ["s3fs", "-o", "use_sse", "-o", f"endpoint={region}", "-o", f"url=https://s3.{region}.amazonaws.com"]
-    if _verbose:
-        cmd += ["-o", "dbglevel=info", "-o", "curldbg"]
-    cmd += [bucket, mountpoint]
-    run(cmd)
-
-    _logger.debug(f"Mounted {mountpoint}")
-    return mountpoint
-
-
-def unmount_bucket(mountpoint: str) -> None:
-    """Unmount a previously mounted S3 bucket.
+    matches = []
+    for pattern in patterns:
+        dirname, basename = os.path.split(pattern)
+        if glob.has_magic(dirname) or not glob.has_magic(basename):
+            matches += glob.glob(pattern, recursive=True)
+            continue
+
+        regex = re.compile(fnmatch.translate(basename))
+        # Match glob's rule: wildcards never match hidden files unless the pattern asks for them.
+        hidden = basename.startswith(".")
+        try:
+            with os.scandir(dirname or ".") as entries:
+                matches += [
+                    entry.path
+                    for entry in entries
+                    if (hidden or not entry.name.startswith(".")) and regex.match(entry.name) and entry.is_file()
+                ]
+        except FileNotFoundError:
+            pass
+    return matches
+
+
+def _backup_one(crypto, key, s3, transfers, bucket: str, prefix: str, source: str) -> None:
+    """Encrypt a single backup file and stream it up to the S3 bucket.
+
+    The encryption stream is handed to the transfer manager unread, so disk reads, KMS/AES work,
+    and part uploads for one file proceed concurrently: while a multipart part is in flight the
+    next part is already being read and encrypted.
 
     Args:
-        mountpoint (str): The mount point path.
+        crypto (awscrypt.EncryptionSDKClient): AWS client side encryption instance.
+        key (awscrypt.StrictAwsKmsMasterKeyProvider): AWS key provider instance.
+        s3: S3 client instance.
+        transfers (boto3.s3.transfer.TransferConfig): Transfer manager configuration.
+        bucket (str): Bucket name.
+        prefix (str): Key prefix (service name) under which to store the file.
+        source (str): File to encrypt and upload.
     """
-    _logger.debug("Unmounting S3 bucket")
-    cmd = ["fusermount", "-u", mountpoint]
-    run(cmd)
-    os.rmdir(mountpoint)
+    target = f"{prefix}/{os.path.basename(source)}"
+    _logger.debug("Encrypting %s to s3://%s/%s", source, bucket, target)
+    with open(source, mode="rb", buffering=_IO_BUFFER_SIZE) as instream:
+        with crypto.stream(mode="e", source=instream, key_provider=key) as cryptor:
+            s3.upload_fileobj(cryptor, bucket, target, Config=transfers)
 
 
 def backup(args: argparse.Namespace) -> None:
-    """Collect up all configured backup files, encrypt them, and sync them to an S3 bucket.
+    """Collect up all configured backup files, encrypt them, and upload them to an S3 bucket.
 
     Args:
         args (argparse.Namespace): Command line parameters and services list.
     """
+    import boto3.s3.transfer
+
     secrets = load_secrets()
 
     os.environ["AWS_ACCESS_KEY_ID"] = secrets["apis"]["aws"]["key"]
     os.environ["AWS_SECRET_ACCESS_KEY"] = secrets["apis"]["aws"]["secret"]
 
-    crypto = awscrypt.EncryptionSDKClient()
-    key = awscrypt.StrictAwsKmsMasterKeyProvider(key_ids=[secrets["services"]["backup"]["key_arn"]])
-    mountpoint = mount_bucket(secrets["services"]["backup"]["bucket"], secrets["services"]["backup"]["region"])
-
-    for service in args.services:
-        if service.deployed and service.backups:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                for pattern in service.backups:
-                    for source in glob.iglob(pattern):
-                        dest = os.path.join(tmpdir, os.path.basename(source))
-                        xcrypt(crypto, key, True, source, dest)
-
-                cmd = ["rsync", "--recursive", "--delete-during", "--whole-file", "--fsync"]
-                if _verbose:
-                    cmd.append("--verbose")
-                cmd += [tmpdir + "/", os.path.join(mountpoint, service.name)]
-                run(cmd)
+    crypto, key, s3, bucket = make_bucket_client(secrets)
+    transfers = boto3.s3.transfer.TransferConfig(multipart_chunksize=8 << 20, max_concurrency=8)
 
-    unmount_bucket(mountpoint)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        # Each file's KMS round-trip, encryption stream, and upload are independent, so overlap them.
+        futures = [
+            pool.submit(_backup_one, crypto, key, s3, transfers, bucket, service.name, source)
+            for service in args.services
+            if service.deployed and service.backups
+            for source in _find_backups(service.backups)
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
 
     del os.environ["AWS_ACCESS_KEY_ID"]
     del os.environ["AWS_SECRET_ACCESS_KEY"]
@@ -349,10 +452,18 @@ def secrets(args: argparse.Namespace) -> None:
     secrets = load_secrets()
     templates = load_templates(args)
 
-    for name, template in templates.items():
+    def generate_one(name: str, template: jinja2.Template) -> None:
+        _logger.debug("Generating %s", name)
         with open(name, mode="w") as target:
-            _logger.debug(f"Generating {name}")
             template.stream(secrets=secrets).dump(target)
+
+    if templates:
+        # Each template renders to its own file and only reads the shared secrets tree, so the
+        # renders and writes can proceed in parallel.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(templates))) as pool:
+            futures = [pool.submit(generate_one, name, template) for name, template in templates.items()]
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
     del secrets
 
 
@@ -367,22 +478,42 @@ def fetch(args: argparse.Namespace) -> None:
     os.environ["AWS_ACCESS_KEY_ID"] = secrets["apis"]["aws"]["key"]
     os.environ["AWS_SECRET_ACCESS_KEY"] = secrets["apis"]["aws"]["secret"]
 
-    crypto = awscrypt.EncryptionSDKClient()
-    key = awscrypt.StrictAwsKmsMasterKeyProvider(key_ids=[secrets["services"]["backup"]["key_arn"]])
-    mountpoint = mount_bucket(secrets["services"]["backup"]["bucket"], secrets["services"]["backup"]["region"])
+    crypto, key, s3, bucket = make_bucket_client(secrets)
 
     for service in args.services:
         if service.selected:
-            source = os.path.join(mountpoint, service.name, args.file)
-            dest = args.file
-            xcrypt(crypto, key, False, source, dest)
-
-    unmount_bucket(mountpoint)
+            source = f"{service.name}/{args.file}"
+            _logger.debug("Decrypting s3://%s/%s to %s", bucket, source, args.file)
+            response = s3.get_object(Bucket=bucket, Key=source)
+            with open(args.file, mode="wb", buffering=_IO_BUFFER_SIZE) as outstream:
+                with crypto.stream(mode="d", source=response["Body"], key_provider=key) as cryptor:
+                    shutil.copyfileobj(cryptor, outstream, length=_IO_BUFFER_SIZE)
 
     del os.environ["AWS_ACCESS_KEY_ID"]
     del os.environ["AWS_SECRET_ACCESS_KEY"]
 
 
+def _template_environment() -> jinja2.Environment:
+    """Fetch the shared Jinja2 environment, creating it on first use.
+
+    Returns:
+        jinja2.Environment: Shared environment instance.
+    """
+    global _template_env
+    if _template_env is None:
+        import jinja2
+
+        autoescape = jinja2.select_autoescape(disabled_extensions=("txt", "sh", "jinja"))
+        _template_env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader("."),
+            keep_trailing_newline=True,
+            autoescape=autoescape,
+            auto_reload=True,
+            cache_size=400,
+        )
+    return _template_env
+
+
 def load_templates(args: argparse.Namespace) -> dict[str, jinja2.Template]:
     """Load the secret file templates for deployed services.
 
@@ -393,18 +524,79 @@ def load_templates(args: argparse.Namespace) -> dict[str, jinja2.Template]:
         dict[str, jinja2.Template]: Instantiated Jinja2 templates for each file.
     """
     _logger.debug("Loading templates")
+    env = _template_environment()
     templates = {}
     for service in args.services:
         if service.deployed:
             for path in service.secret_files:
-                template_path = path + ".jinja"
-                with open(template_path, mode="r") as template:
-                    templates[path] = template.read()
+                templates[path] = env.get_template(path + ".jinja")
+    return templates
+
+
+def _write_sidecar(path: str, parsed: dict) -> None:
+    """Atomically (re)write the JSON sidecar cache for a YAML file.
 
-    loader = jinja2.DictLoader(templates)
-    autoescape = jinja2.select_autoescape(disabled_extensions=("txt", "sh"))
-    env = jinja2.Environment(loader=loader, keep_trailing_newline=True, autoescape=autoescape)
-    return {name: env.get_template(name) for name in templates}
+    Args:
+        path (str): Path of the sidecar file.
+        parsed (dict): Parsed content of the YAML file.
+    """
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".json")
+        with os.fdopen(fd, mode="w") as cache:
+            json.dump(parsed, cache)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        # The sidecar is only an optimization; carry on without it, e.g. if the directory is not
+        # writable or the YAML holds values (such as dates) that JSON cannot represent.
+        _logger.debug("Unable to write %s", path)
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+
+def _load_yaml(path: str, sidecar: bool = False) -> dict:
+    """Load and parse a YAML file, reusing the previously parsed content if the file is unchanged.
+
+    Cached entries are keyed on the file's modification time and size, and are shared between
+    callers, so the returned tree must not be mutated.
+
+    Args:
+        path (str): Path of the YAML file to load.
+        sidecar (bool, optional): Maintain a JSON sidecar cache next to the YAML file and prefer it
+            when it is at least as new, skipping YAML parsing entirely. Defaults to False.
+
+    Returns:
+        dict: Parsed file content.
+    """
+    info = os.stat(path)
+    cached = _yaml_cache.get(path)
+    if cached and cached[0] == info.st_mtime_ns and cached[1] == info.st_size:
+        _yaml_cache.move_to_end(path)
+        return cached[2]
+
+    parsed = None
+    sidecar_path = path + ".json"
+    if sidecar:
+        try:
+            if os.stat(sidecar_path).st_mtime_ns >= info.st_mtime_ns:
+                with open(sidecar_path, mode="r") as cache:
+                    parsed = json.load(cache)
+        except (OSError, ValueError):
+            parsed = None
+
+    if parsed is None:
+        with open(path, mode="r") as cfg:
+            parsed = yaml.load(cfg, Loader=_YAML_LOADER)
+        if sidecar:
+            _write_sidecar(sidecar_path, parsed)
+
+    _yaml_cache[path] = (info.st_mtime_ns, info.st_size, parsed)
+    while len(_yaml_cache) > _YAML_CACHE_SIZE:
+        _yaml_cache.popitem(last=False)
+    return parsed
 
 
 def load_secrets() -> dict:
@@ -414,9 +606,7 @@ def load_secrets() -> dict:
         dict: Tree of secrets.
     """
     _logger.info("Loading secrets")
-    with open(_SECRET_CFG, mode="r") as cfg:
-        secret_entries = yaml.safe_load(cfg)
-    return secret_entries["secrets"]
+    return _load_yaml(_SECRET_CFG, sidecar=_SECRET_SIDECAR)["secrets"]
 
 
 def load_services() -> list[Service]:
@@ -426,19 +616,16 @@ def load_services() -> list[Service]:
         list[Service]: List of configured services.
     """
     _logger.info("Loading service configuration")
-    with open(_SERVICE_CFG, mode="r") as cfg:
-        service_entries = yaml.safe_load(cfg)
-    services = service_entries.get("services", {})
+    services = _load_yaml(_SERVICE_CFG, sidecar=True).get("services", {})
 
     state = {}
     try:
-        with open(_STATE_CFG, mode="r") as cfg:
-            state = yaml.safe_load(cfg)
+        state = _load_yaml(_STATE_CFG)
     except FileNotFoundError:
         pass
     deployed = state.get("deployed", {})
 
-    return [Service(s, services[s], deployed.get(s, False)) for s in services]
+    return [Service.from_yaml(s, services[s], deployed.get(s, False)) for s in services]
 
 
 def make_argparser(services: list[Service]) -> argparse.ArgumentParser:
@@ -451,8 +638,10 @@ def make_argparser(services: list[Service]) -> argparse.ArgumentParser:
         argparse.ArgumentParser: Argument parser instance, ready for use.
     """
 
+    names = [s.name for s in services]
+
     def add_service_param(subparser: argparse.ArgumentParser) -> None:
-        subparser.add_argument("service", help="service(s)", nargs="+", choices=[s.name for s in services])
+        subparser.add_argument("service", help="service(s)", nargs="+", choices=names)
 
     parser = argparse.ArgumentParser(description="Vairë service management tool")
     parser.add_argument("-v", "--verbose", help="turn on verbose output", action="store_true")
@@ -496,7 +685,7 @@ def make_argparser(services: list[Service]) -> argparse.ArgumentParser:
     parser_fetch = subparsers.add_parser(
         "fetch", help="fetch a stored backup file and place the decrypted version in the CWD"
     )
-    parser_fetch.add_argument("service", help="service", choices=[s.name for s in services])
+    parser_fetch.add_argument("service", help="service", choices=names)
     parser_fetch.add_argument("file", help="backup file to retrieve from S3")
     parser_fetch.set_defaults(func=fetch, services=services)
 
@@ -520,11 +709,11 @@ def parse_arguments(parser: argparse.ArgumentParser) -> argparse.Namespace:
     if _verbose:
         _logger.setLevel(logging.DEBUG)
 
-    for service in args.services:
-        if isinstance(args.service, str) and service.name == args.service:
-            service.selected = True
-        elif isinstance(args.service, list) and service.name in args.service:
-            service.selected = True
+    selected = frozenset([args.service] if isinstance(args.service, str) else args.service)
+    if selected:
+        for service in args.services:
+            if service.name in selected:
+                service.selected = True
 
     return args
 